@@ -1,12 +1,11 @@
 import argparse
 import sys
+import time
 from pathlib import Path
-from typing import List
 
-from bitarray import bitarray
 from loguru import logger
 from PySide6.QtCore import Qt, QTimer, QUrl
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QImage, QPixmap, qRgb
 from PySide6.QtMultimedia import QSoundEffect
 from PySide6.QtWidgets import (
     QApplication,
@@ -15,6 +14,7 @@ from PySide6.QtWidgets import (
     QMainWindow,
 )
 
+from chip8emulator.clock import Clock
 from chip8emulator.graphics import Graphics
 from chip8emulator.keypad import Keypad
 from chip8emulator.memory import Memory
@@ -22,7 +22,7 @@ from chip8emulator.processor import Processor
 
 parser = argparse.ArgumentParser()
 parser.add_argument("rom_path", nargs="?", default="roms/IBM Logo.ch8")
-parser.add_argument("--ips", type=int, default=10, help="Instructions per second")
+parser.add_argument("--ips", type=int, default=700, help="Instructions per second")
 parser.add_argument(
     "--debug",
     action="store_true",
@@ -49,19 +49,28 @@ class Chip8Screen(QGraphicsView):
         self.scene = QGraphicsScene()
         self.setScene(self.scene)
 
-        # Image is the actual image that will be rendered
-        self.image = QImage(self.width, self.height, QImage.Format_Mono)
-        self.scene.addPixmap(QPixmap.fromImage(self.image))
-
-    def refresh(self, pixels: List[bitarray]):
-        self.scene.clear()
-
-        # Update the image with the current status of the pixels
-        for y, row in enumerate(pixels):
-            for x, pixel in enumerate(row):
-                self.image.setPixel(x, y, int(pixel))
+        # Pixels set to 0 are rendered black, and pixels set to 1, white
+        self.color_table = [qRgb(0, 0, 0), qRgb(255, 255, 255)]
+
+        # Pixmap item that renders the image of the screen. It is kept in the
+        # scene and only its pixmap is replaced on every refresh.
+        self.pixmap_item = self.scene.addPixmap(QPixmap())
+        self.refresh(graphic_system)
+
+    def refresh(self, graphics: Graphics):
+        # Build the image with the current status of the pixels in a single call.
+        # The pixel-bytes of the graphics are already laid out as a mono image.
+        self.buffer = graphics.as_bytes()
+        self.image = QImage(
+            self.buffer,
+            self.width,
+            self.height,
+            (self.width + 7) // 8,
+            QImage.Format_Mono,
+        )
+        self.image.setColorTable(self.color_table)
 
-        self.scene.addPixmap(QPixmap.fromImage(self.image))
+        self.pixmap_item.setPixmap(QPixmap.fromImage(self.image))
 
 
 class Chip8MainWindow(QMainWindow):
@@ -100,7 +109,7 @@ class Chip8MainWindow(QMainWindow):
         if key in self.keymap:
             self.chip8.keypad.press_key(self.keymap[key])
         else:
-            logger.debug(f"Key {key} not mapped")
+            logger.debug("Key {} not mapped", key)
 
     def keyReleaseEvent(self, event):
         key = event.key()
@@ -112,7 +121,7 @@ class Chip8MainWindow(QMainWindow):
         if key in self.keymap:
             self.chip8.keypad.release_key(self.keymap[key])
         else:
-            logger.debug(f"Key {key} not mapped")
+            logger.debug("Key {} not mapped", key)
 
 
 class Chip8Application(QApplication):
@@ -124,11 +133,11 @@ class Chip8Application(QApplication):
     screen of the emulated system.
     """
 
-    def __init__(self, rom: Path, ips: int = 10):
+    def __init__(self, rom: Path, ips: int = 700):
         """
         Args:
             rom (Path): Path to the ROM file that will be loaded into the emulator.
-            ips (int, optional): Instructions Per Second. Defaults to 7.
+            ips (int, optional): Instructions Per Second. Defaults to 700.
         """
         super().__init__()
         self.processor = Processor(
@@ -138,7 +147,6 @@ class Chip8Application(QApplication):
         )
         self.processor.reset()
         self.rom = rom
-        self.ips = ips
 
         # Differences between the Window and the Screen:
         # - The Window contains all the elements visible to the user
@@ -149,9 +157,13 @@ class Chip8Application(QApplication):
         self.screen = Chip8Screen(self.processor.graphics)
         self.main_window = Chip8MainWindow(self.processor, self.screen)
 
+        # The timer triggers the emulator's cycles once per frame, at 60 frames per
+        # second. On every frame, the processor runs as many instructions and timer
+        # ticks (at 60 Hz) as correspond to the time elapsed since the previous frame.
         self.timer = QTimer()
-        self.timer.setInterval(1 / self.ips * 1000)
+        self.timer.setInterval(1000 // 60)
         self.timer.timeout.connect(self.update)
+        self.clock = Clock(ips=ips, now=time.perf_counter())
 
         self.beep = QSoundEffect()
         self.beep.setSource(
@@ -168,15 +180,22 @@ class Chip8Application(QApplication):
         logger.debug(f"ROM {self.rom} loaded into memory")
 
         # Start the timer that will trigger the emulator's cycles
+        self.clock.last_update = time.perf_counter()
         self.timer.start()
 
         # Show the main window
         self.main_window.show()
 
     def update(self):
-        self.processor.emulate(7)
+        cycles, ticks = self.clock.advance(time.perf_counter())
+
+        self.processor.emulate(cycles)
+        for _ in range(ticks):
+            self.processor.update_timers()
+
         if self.processor.redraw:
-            self.screen.refresh(self.processor.graphics.pixels)
+            self.screen.refresh(self.processor.graphics)
+            self.processor.redraw = False
 
         if self.processor.sound_flag:
             self.beep.play()
@@ -0,0 +1,43 @@
+# Longest time, in seconds, the emulator catches up with in a single frame. Longer
+# stalls (dragging the window, system suspend, a debugger breakpoint...) are dropped
+# instead of being emulated all at once.
+MAX_FRAME_TIME = 0.1
+
+# The delay and sound timers count down at 60 Hz
+TIMER_FREQUENCY = 60
+
+
+class Clock:
+    """
+    Turns the time elapsed between frames into the number of instructions and timer
+    ticks to run. The fractions left over are carried over to the next frame.
+    """
+
+    def __init__(self, ips: int = 700, now: float = 0.0):
+        """
+        Args:
+            ips (int, optional): Instructions Per Second. Defaults to 700.
+            now (float, optional): Time, in seconds, the clock starts at.
+        """
+        self.ips = ips
+        self.last_update = now
+        self.pending_cycles = 0.0
+        self.pending_timer_ticks = 0.0
+
+    def advance(self, now: float) -> tuple[int, int]:
+        """
+        Advance the clock to `now`, in seconds, and return the number of cycles and
+        timer ticks that correspond to the time elapsed since the previous call.
+        """
+        elapsed = min(now - self.last_update, MAX_FRAME_TIME)
+        self.last_update = now
+
+        self.pending_cycles += elapsed * self.ips
+        cycles = int(self.pending_cycles)
+        self.pending_cycles -= cycles
+
+        self.pending_timer_ticks += elapsed * TIMER_FREQUENCY
+        ticks = int(self.pending_timer_ticks)
+        self.pending_timer_ticks -= ticks
+
+        return cycles, ticks
@@ -1,9 +1,74 @@
 from chip8emulator.opcodes import OPCODE
 
+# Opcodes of the 0x8000 family, selected by their last nibble
+_ARITHMETIC_OPCODES = {
+    0x0000: OPCODE.x8XY0,
+    0x0001: OPCODE.x8XY1,
+    0x0002: OPCODE.x8XY2,
+    0x0003: OPCODE.x8XY3,
+    0x0004: OPCODE.x8XY4,
+    0x0005: OPCODE.x8XY5,
+    0x0006: OPCODE.x8XY6,
+    0x0007: OPCODE.x8XY7,
+    0x000E: OPCODE.x8XYE,
+}
 
-def decode(opcode: int) -> OPCODE:
+# Opcodes of the 0xE000 family, selected by their low byte
+_KEY_OPCODES = {
+    0x009E: OPCODE.xEX9E,
+    0x00A1: OPCODE.xEXA1,
+}
+
+# Opcodes of the 0xF000 family, selected by their low byte
+_MISC_OPCODES = {
+    0x0007: OPCODE.xFX07,
+    0x000A: OPCODE.xFX0A,
+    0x0015: OPCODE.xFX15,
+    0x0018: OPCODE.xFX18,
+    0x001E: OPCODE.xFX1E,
+    0x0029: OPCODE.xFX29,
+    0x0033: OPCODE.xFX33,
+    0x0055: OPCODE.xFX55,
+    0x0065: OPCODE.xFX65,
+}
+
+
+def _decode_system(opcode: int) -> OPCODE | None:
+    """Decode the opcodes of the 0x0000 family"""
+    if opcode & 0x00EE == 0x00EE:
+        return OPCODE.x00EE
+    if opcode & 0x00E0 == 0x00E0:
+        return OPCODE.x00E0
+    return None
+
+
+# Decoder of every opcode family, indexed by the first nibble of the opcode
+_FAMILY_DECODERS = (
+    _decode_system,
+    # Jump to address NNN
+    lambda opcode: OPCODE.x1NNN,
+    # Call to subroutine at NNN
+    lambda opcode: OPCODE.x2NNN,
+    lambda opcode: OPCODE.x3XNN,
+    lambda opcode: OPCODE.x4XNN,
+    lambda opcode: OPCODE.x5XY0,
+    lambda opcode: OPCODE.x6XNN,
+    lambda opcode: OPCODE.x7XNN,
+    lambda opcode: _ARITHMETIC_OPCODES.get(opcode & 0x000F),
+    lambda opcode: OPCODE.x9XY0,
+    lambda opcode: OPCODE.xANNN,
+    lambda opcode: OPCODE.xBNNN,
+    lambda opcode: OPCODE.xCXNN,
+    lambda opcode: OPCODE.xDXYN,
+    lambda opcode: _KEY_OPCODES.get(opcode & 0x00FF),
+    lambda opcode: _MISC_OPCODES.get(opcode & 0x00FF),
+)
+
+
+def _decode(opcode: int) -> OPCODE | None:
     """
-    Decode the opcode and return the corresponding enum value.
+    Decode the opcode and return the corresponding enum value. Used to build the
+    lookup table at import time, use `decode` instead.
 
     Args:
         opcode (int): Opcode to decode.
@@ -11,84 +76,32 @@ def decode(opcode: int) -> OPCODE:
     Returns:
         Opcodes: Enum value corresponding to the opcode.
     """
-    match opcode & 0xF000:
-        case 0x1000:
-            # Jump to address NNN
-            return OPCODE.x1NNN
-        case 0x2000:
-            # Call to subroutine at NNN
-            return OPCODE.x2NNN
-        case 0x3000:
-            return OPCODE.x3XNN
-        case 0x4000:
-            return OPCODE.x4XNN
-        case 0x5000:
-            return OPCODE.x5XY0
-        case 0x6000:
-            return OPCODE.x6XNN
-        case 0x7000:
-            return OPCODE.x7XNN
-        case 0x8000:
-            match opcode & 0x000F:
-                case 0x0000:
-                    return OPCODE.x8XY0
-                case 0x0001:
-                    return OPCODE.x8XY1
-                case 0x0002:
-                    return OPCODE.x8XY2
-                case 0x0003:
-                    return OPCODE.x8XY3
-                case 0x0004:
-                    return OPCODE.x8XY4
-                case 0x0005:
-                    return OPCODE.x8XY5
-                case 0x0006:
-                    return OPCODE.x8XY6
-                case 0x0007:
-                    return OPCODE.x8XY7
-                case 0x000E:
-                    return OPCODE.x8XYE
-        case 0x9000:
-            return OPCODE.x9XY0
-        case 0xA000:
-            return OPCODE.xANNN
-        case 0xB000:
-            return OPCODE.xBNNN
-        case 0xC000:
-            return OPCODE.xCXNN
-        case 0xD000:
-            return OPCODE.xDXYN
-        case 0xE000:
-            match opcode & 0x00FF:
-                case 0x009E:
-                    return OPCODE.xEX9E
-                case 0x00A1:
-                    return OPCODE.xEXA1
-        case 0xF000:
-            match opcode & 0x00FF:
-                case 0x0007:
-                    return OPCODE.xFX07
-                case 0x000A:
-                    return OPCODE.xFX0A
-                case 0x0015:
-                    return OPCODE.xFX15
-                case 0x0018:
-                    return OPCODE.xFX18
-                case 0x001E:
-                    return OPCODE.xFX1E
-                case 0x0029:
-                    return OPCODE.xFX29
-                case 0x0033:
-                    return OPCODE.xFX33
-                case 0x0055:
-                    return OPCODE.xFX55
-                case 0x0065:
-                    return OPCODE.xFX65
-
-    match opcode & 0x00E0:
-        case 0x00E0:
-            match opcode & 0x00EE:
-                case 0x00EE:
-                    return OPCODE.x00EE
-                case _:
-                    return OPCODE.x00E0
+    return _FAMILY_DECODERS[opcode >> 12](opcode)
+
+
+# There are only 65536 possible opcodes, so all of them are decoded once at import
+# time and `decode` is reduced to a single list lookup.
+DECODE_TABLE: list[OPCODE | None] = [_decode(opcode) for opcode in range(0x10000)]
+
+
+def decode(opcode: int) -> OPCODE | None:
+    """
+    Decode the opcode and return the corresponding enum value.
+
+    Args:
+        opcode (int): Opcode to decode.
+
+    Returns:
+        Opcodes: Enum value corresponding to the opcode, or None if the opcode is
+            not supported.
+    """
+    return DECODE_TABLE[opcode]
+
+
+# Register operands (X, Y) of every opcode, taken from its second and third nibbles,
+# so handlers do not need to mask and shift the opcode on every instruction. There are
+# only 256 different pairs, which are shared by all the opcodes.
+_REGISTER_PAIRS = [(x, y) for x in range(16) for y in range(16)]
+REGISTERS_TABLE: list[tuple[int, int]] = [
+    _REGISTER_PAIRS[(opcode >> 4) & 0xFF] for opcode in range(0x10000)
+]
@@ -1,7 +1,47 @@
-from functools import reduce
+from functools import cache
 
 from bitarray import bitarray
-from bitarray.util import ba2int, int2ba
+from bitarray.util import int2ba
+
+# Translation table to print the pixels as text
+_PIXELS_AS_TEXT = str.maketrans("01", ".X")
+
+
+def _to_row(value: int, x: int, width: int) -> int:
+    """
+    Place a byte at the specified X coordinate of a row. If the byte does not
+    fit in the screen, it is wrapped around.
+
+    Args:
+        value (int): Byte to place.
+        x (int): X coordinate.
+        width (int): Screen width, in bits.
+
+    Returns:
+        int: Row with the byte placed at the X coordinate.
+    """
+    shift = width - 8 - x
+    if shift >= 0:
+        return value << shift
+
+    # The end of the byte is wrapped to the beginning of the row
+    return value >> -shift | (value << (width + shift)) & ((1 << width) - 1)
+
+
+@cache
+def _sprite_rows(width: int) -> list[list[int]]:
+    """
+    Rows with every byte value placed at every X coordinate, indexed as
+    `[x][value]`. There are only `width * 256` of them, so drawing a sprite line
+    is reduced to a table lookup. Computed once per screen width.
+
+    Args:
+        width (int): Screen width, in bits.
+
+    Returns:
+        list[list[int]]: Row for every X coordinate and byte value.
+    """
+    return [[_to_row(value, x, width) for value in range(256)] for x in range(width)]
 
 
 class Graphics:
@@ -10,6 +50,10 @@ class Graphics:
         Graphic interface for the Chip-8 emulator. Width and Height are provided for
         testing purposes, since the original Chip-8 had a screen size of 64x32 pixels.
 
+        Each row of the screen is stored as a single integer, where the most
+        significant bit is the left-most pixel. This way, a whole sprite row can be
+        drawn with a couple of bitwise operations.
+
         Args:
             width (int, optional): Screen width, in bits. Defaults to 64.
             height (int, optional): Screen height, in bits. Defaults to 32.
@@ -22,7 +66,7 @@ class Graphics:
         """
         Clear the screen by setting all pixels to 0.
         """
-        self.pixels = [bitarray("0" * self.width) for _ in range(self.height)]
+        self.pixels = [0] * self.height
 
     def get(self, x: int, y: int) -> int:
         """
@@ -41,7 +85,7 @@ class Graphics:
                 f"Pixel out of bounds: ({x}, {y}). Screen size: {self.width}x{self.height}"
             )
 
-        return self.pixels[y][x]
+        return (self.pixels[y] >> (self.width - 1 - x)) & 1
 
     def get_byte(self, x: int, y: int) -> int:
         """
@@ -60,19 +104,13 @@ class Graphics:
                 f"Pixel out of bounds: ({x}, {y}). Screen size: {self.width}x{self.height}"
             )
 
-        length = 8
-        end = x + length
-
-        if end > self.width:
-            end = self.width
-            length = end - x
+        row = self.pixels[y]
+        shift = self.width - 8 - x
+        if shift >= 0:
+            return (row >> shift) & 0xFF
 
-        screen_line = self.pixels[y][x:end]
-        if len(screen_line) == 8:
-            return ba2int(screen_line, signed=False)
-        else:
-            rest = self.pixels[y][0 : 8 - len(screen_line)]
-            return ba2int(screen_line + rest, signed=False)
+        # The end of the byte is read from the beginning of the row
+        return (row << -shift | row >> (self.width + shift)) & 0xFF
 
     def set(self, x: int, y: int, value: int) -> None:
         """
@@ -92,12 +130,17 @@ class Graphics:
         if value not in (0, 1):
             raise ValueError("Pixel value must be 0 or 1")
 
-        self.pixels[y][x] = value
+        mask = 1 << (self.width - 1 - x)
+        if value:
+            self.pixels[y] |= mask
+        else:
+            self.pixels[y] &= ~mask
 
     def set_byte(self, x: int, y: int, value: int) -> None:
         """
         Set the pixel byte at the specified coordinates. The origin (0, 0)
-        is at the top-left corner.
+        is at the top-left corner. If the byte does not fit in the screen, it is
+        wrapped around.
 
         Args:
             x (int): X coordinate.
@@ -112,37 +155,67 @@ class Graphics:
         if value < 0 or value > 255:
             raise ValueError("Pixel value must be between 0 and 255 (0xFF)")
 
-        length = 8
-        end = x + length
+        rows = _sprite_rows(self.width)[x]
+        self.pixels[y] = self.pixels[y] & ~rows[0xFF] | rows[value]
 
-        # The length is always specified as 8 to ensure that leading 0s are kept.
-        if end > self.width:
-            # If the sprite is bigger than the screen, it is wrapped around.
-            draw_to = self.width - x
-            self.pixels[y][x : self.width] = int2ba(value, length=8)[:draw_to]
-            wrapped = end - self.width
-            self.pixels[y][0 : end - self.width] = int2ba(value, length=8)[-wrapped:]
-        else:
-            self.pixels[y][x:end] = int2ba(value, length=8)[:length]
+    def xor_byte(self, x: int, y: int, value: int) -> int:
+        """
+        Flip the pixel byte at the specified coordinates with a bitwise XOR against
+        the given value, as sprites are drawn. The origin (0, 0) is at the top-left
+        corner. If the byte does not fit in the screen, it is wrapped around.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            value (int): Value to XOR the pixel-byte with.
+
+        Returns:
+            int: 1 if any pixel was turned off, 0 otherwise.
+        """
+        if x >= self.width or y >= self.height:
+            raise IndexError(
+                f"Pixel out of bounds: ({x}, {y}). Screen size: {self.width}x{self.height}"
+            )
+
+        if value < 0 or value > 255:
+            raise ValueError("Pixel value must be between 0 and 255 (0xFF)")
+
+        sprite = _sprite_rows(self.width)[x][value]
+        row = self.pixels[y]
+        self.pixels[y] = row ^ sprite
+
+        return int((row & sprite) != 0)
+
+    def as_bytes(self) -> bytes:
+        """
+        Convert the pixel values to bytes, one per pixel-byte. If the width is not
+        a multiple of 8, every row is padded with 0s on the right up to the next
+        byte, as mono images expect.
+        """
+        row_length = (self.width + 7) // 8
+        padding = row_length * 8 - self.width
+        return b"".join((row << padding).to_bytes(row_length) for row in self.pixels)
 
     def as_list_of_integers(self) -> list[int]:
         """
-        Convert the pixel values to a list of integers.
+        Convert the pixel values to a list of integers, one per pixel-byte.
         """
-        return [ba2int(self.pixels[i : i + 8]) for i in range(0, len(self.pixels), 8)]
+        return list(self.as_bytes())
 
     def as_bitarray(self) -> bitarray:
         """
-        Convert the pixel values to a bitarray.
+        Convert the pixel values to a bitarray, one bit per pixel, row after row.
         """
-        return reduce(lambda x, y: x + y, self.pixels)
+        pixels = bitarray()
+        for row in self.pixels:
+            pixels.extend(int2ba(row, length=self.width))
+        return pixels
 
     def __repr__(self) -> str:
         """
         Print the graphic's pixels as a string of 'X' and '.' to represent the 1s and 0s.
         """
-        rows = []
-        for row in self.pixels:
-            rows.append(row.to01().replace("1", "X").replace("0", "."))
-
-        return "\n".join(rows)
+        return "\n".join(
+            format(row, f"0{self.width}b").translate(_PIXELS_AS_TEXT)
+            for row in self.pixels
+        )
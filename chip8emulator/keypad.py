@@ -3,25 +3,9 @@ from loguru import logger
 
 class Keypad:
     def __init__(self) -> None:
-        # Keymap, indicating if a key is currently being pressed
-        self.keys = {
-            0x0: False,
-            0x1: False,
-            0x2: False,
-            0x3: False,
-            0x4: False,
-            0x5: False,
-            0x6: False,
-            0x7: False,
-            0x8: False,
-            0x9: False,
-            0xA: False,
-            0xB: False,
-            0xC: False,
-            0xD: False,
-            0xE: False,
-            0xF: False,
-        }
+        # Keymap, indicating if a key is currently being pressed. Each key is a bit
+        # of the integer, key 0x0 being the least significant one.
+        self.keys = 0
         # Last pressed-released key
         self.accumulator = -1
 
@@ -31,7 +15,7 @@ class Keypad:
 
     def is_key_pressed(self, key: int) -> bool:
         """Indicates if a key is currently being pressed"""
-        return self.keys[key]
+        return (self.keys >> key) & 1 == 1
 
     def get_pressed_key(self) -> int:
         """Returns the last pressed key"""
@@ -44,20 +28,20 @@ class Keypad:
 
     def press_key(self, key: int):
         """Set a key as currently be pressed"""
-        if key in self.keys:
-            self.keys[key] = True
+        if 0x0 <= key <= 0xF:
+            self.keys |= 1 << key
         else:
-            logger.debug(f"Invalid key pressed: {key}")
+            logger.debug("Invalid key pressed: {}", key)
 
     def release_key(self, key: int):
         """Set a key as currently be released. This will make the key be available to
         be read"""
-        if key in self.keys:
-            self.keys[key] = False
+        if 0x0 <= key <= 0xF:
+            self.keys &= ~(1 << key)
             # On the original COSMAC VIP, the key was only registered when it was
             # pressed and then released.
             # self.accumulator.append(key)
             self.accumulator = key
             logger.debug(self.accumulator)
         else:
-            logger.debug(f"Invalid key released: {key}")
+            logger.debug("Invalid key released: {}", key)
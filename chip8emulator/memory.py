@@ -1,37 +1,40 @@
-from collections import UserList
+class Memory:
+    """Memory backed by a bytearray. Out of range addresses and slice writes that do not
+    match the length of the slice raise IndexError."""
 
+    __slots__ = ("data",)
 
-class Memory(UserList):
-    def __init__(self, data: list[int] = None):
+    def __init__(self, data: bytes | list[int] | None = None):
         if data:
-            self.data = data
+            self.data = bytearray(data)
         else:
-            self.data = [0x0] * 4096
+            self.data = bytearray(4096)
 
-    def _validate_address(self, address: int) -> bool:
-        if 0 < address > len(self.data):
-            raise ValueError(f"Memory address {address} is not valid")
-
-        return True
-
-    def __getitem__(self, address: int | slice) -> int:
-        if isinstance(address, slice):
-            self._validate_address(address.start)
-            self._validate_address(address.stop)
-        else:
-            self._validate_address(address)
+    def __len__(self) -> int:
+        return len(self.data)
 
+    def __getitem__(self, address: int | slice) -> int | bytearray:
+        self._validate_address(address)
         return self.data[address]
 
-    def __setitem__(self, address: int, value: bytes | int) -> int:
+    def __setitem__(self, address: int | slice, value: bytes | int) -> None:
         self._validate_address(address)
-
-        if isinstance(value, int) and value.bit_length() > 8:
-            raise ValueError(f"Value too large: {value.bit_length()} bits")
-
-        if isinstance(value, bytes):
+        if isinstance(address, slice):
+            if len(value) != len(range(*address.indices(len(self.data)))):
+                raise IndexError(
+                    f"Cannot write {len(value)} bytes to memory range "
+                    f"{address.start}:{address.stop}"
+                )
+        elif isinstance(value, bytes):
             value = int.from_bytes(value, byteorder="big")
 
         self.data[address] = value
 
-        return self.data[address]
+    def _validate_address(self, address: int | slice) -> None:
+        if isinstance(address, slice):
+            size = len(self.data)
+            for bound in (address.start, address.stop):
+                if bound is not None and not 0 <= bound <= size:
+                    raise IndexError(f"Memory address out of range: {bound}")
+        elif address < 0:
+            raise IndexError(f"Memory address out of range: {address}")
@@ -1,19 +1,20 @@
 import random
 from pathlib import Path
+from struct import Struct
 
 from loguru import logger
 
-from chip8emulator.decoder import decode
+from chip8emulator.decoder import DECODE_TABLE, REGISTERS_TABLE
 from chip8emulator.graphics import Graphics
 from chip8emulator.keypad import Keypad
 from chip8emulator.memory import Memory
-from chip8emulator.opcodes import (
-    OPCODE,
-    get_fourth_nibble,
-    get_low_byte,
-    get_second_nibble,
-    get_third_nibble,
-)
+from chip8emulator.opcodes import OPCODE
+
+# Opcodes are stored in memory as big-endian, 2 bytes long, words
+_OPCODE = Struct(">H")
+
+# Binary-coded decimal digits (hundreds, tens, units) of every byte value, for FX33
+_BCD = [bytes((value // 100, value // 10 % 10, value % 10)) for value in range(256)]
 
 
 class Processor:
@@ -22,12 +23,26 @@ class Processor:
         self.graphics = graphics
         self.keypad = keypad
 
+        # Jump table with the handler of every possible opcode, so executing an
+        # instruction is a single list lookup. Opcodes that can not be decoded are
+        # handled as 0NNN, which does nothing.
+        # Every handler moves the program counter itself: 2 bytes to continue to the
+        # next instruction, 4 bytes to skip it.
+        handlers = {
+            opcode: getattr(self, f"opcode_{opcode.name[1:]}") for opcode in OPCODE
+        }
+        handlers[None] = self.opcode_0NNN
+        self._handlers = list(map(handlers.__getitem__, DECODE_TABLE))
+
         self.reset()
 
     @property
     def carry_flag(self) -> int:
         """VF is also used as a flag register; many instructions will set it to
-        either 1 or 0 based on some rule, for example using it as a carry flag"""
+        either 1 or 0 based on some rule, for example using it as a carry flag.
+
+        Opcode handlers write `registry[0xF]` directly, to save the property call
+        on every instruction."""
         return self.registry[0xF]
 
     @carry_flag.setter
@@ -38,10 +53,7 @@ class Processor:
         # Registers.
         # VF is also used as a flag register; many instructions will set it to
         # either 1 or 0 based on some rule, for example using it as a carry flag
-        self.registry = {k: v for k, v in enumerate([0] * 16)}
-
-        # Also known as vF
-        self.carry_flag = 0x0
+        self.registry = bytearray(16)
 
         # Program counter
         self.program_counter = 0x200
@@ -57,24 +69,6 @@ class Processor:
         self.stack = [0x0] * 16
         self.stack_pointer = 0x0
 
-        self.font_memory_map = {
-            0x0: None,
-            0x1: None,
-            0x2: None,
-            0x3: None,
-            0x4: None,
-            0x5: None,
-            0x6: None,
-            0x7: None,
-            0x8: None,
-            0x9: None,
-            0xA: None,
-            0xB: None,
-            0xC: None,
-            0xD: None,
-            0xE: None,
-            0xF: None,
-        }
         self.load_font(font_file=Path(__file__).parent / Path("fonts.ch8"))
 
         # Flag that indicates if the CPU is blocked in a blocking operation
@@ -91,55 +85,36 @@ class Processor:
     def load_font(self, font_file: Path) -> None:
         if not font_file.exists():
             raise FileNotFoundError(f"Font file {font_file} not found")
-        with font_file.open("rb") as f:
-            pointer = 0x050
-            for key in self.font_memory_map.keys():
-                self.font_memory_map[key] = pointer
-                bytes_read = 0
-                while bytes_read < 5:
-                    chunk = f.read(1)
-                    if not chunk:
-                        break
-                    self.memory[pointer] = int.from_bytes(chunk)
-                    pointer += 1
-                    bytes_read += 1
+        content = font_file.read_bytes()
+        self.memory[0x050 : 0x050 + len(content)] = content
+
+        # Address of the sprite of every hexadecimal character, indexed by character.
+        # Every sprite is 5 bytes long.
+        self.font_memory_map = [0x050 + 5 * character for character in range(16)]
 
     def load_program(self, program: Path) -> None:
         program = Path(program)
         if not program.exists():
             raise FileNotFoundError(f"Program file {program} not found")
-        with program.open("rb") as f:
-            pointer = 0x200
-            while chunk := f.read(1):
-                self.memory[pointer] = chunk
-                pointer += 1
-
-    def skip_next_instruction(self) -> None:
-        if not self.withhold_execution:
-            self.program_counter += 4
-
-    def continue_to_next_instruction(self) -> None:
-        if not self.withhold_execution:
-            self.program_counter += 2
+        content = program.read_bytes()
+        if 0x200 + len(content) > len(self.memory):
+            raise ValueError(f"Program file {program} does not fit in memory")
+        self.memory[0x200 : 0x200 + len(content)] = content
 
     def fetch_opcode(self) -> int:
-        opcode = (
-            self.memory[self.program_counter] << 8
-            | self.memory[self.program_counter + 1]
-        )
-        return opcode
+        return _OPCODE.unpack_from(self.memory.data, self.program_counter)[0]
 
     def opcode_0NNN(self, opcode: int) -> None:
         pass
 
-    def opcode_00E0(self) -> None:
+    def opcode_00E0(self, opcode: int) -> None:
         """Clear screen"""
         self.graphics.clear()
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
         self.redraw = True
 
-    def opcode_00EE(self) -> None:
+    def opcode_00EE(self, opcode: int) -> None:
         """Return from a subroutine. Restore the program counter to the address
         pointed by the tip of the stack pointer and decrease the stack pointer."""
         # The stack pointer points to the next free position of the stack, so we need
@@ -188,102 +163,85 @@ class Processor:
         Skips the next instruction if VX equals NN (usually the next instruction is
         a jump to skip a code block)
         """
-        registry = get_second_nibble(opcode)
-
-        if registry not in self.registry.keys():
-            raise ValueError(f"Unexpected value {registry}")
+        registry, _ = REGISTERS_TABLE[opcode]
 
-        value = get_low_byte(opcode)
+        value = opcode & 0x00FF
 
         if self.registry[registry] == value:
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_4XNN(self, opcode: int) -> None:
         """
         Skips the next instruction if VX does not equal NN (usually the next instruction
         is a jump to skip a code block)
         """
-        registry = get_second_nibble(opcode)
+        registry, _ = REGISTERS_TABLE[opcode]
 
-        if registry not in self.registry.keys():
-            raise ValueError(f"Unexpected value {registry}")
-
-        value = get_low_byte(opcode)
+        value = opcode & 0x00FF
 
         if self.registry[registry] != value:
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_5XY0(self, opcode: int) -> None:
         """
         Skips the next instruction if VX equals VY (usually the next instruction is a
         jump to skip a code block).
         """
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
-
-        if (
-            registry_x not in self.registry.keys()
-            or registry_y not in self.registry.keys()
-        ):
-            raise ValueError(f"Unexpected value {registry_x} or {registry_y}")
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         if self.registry[registry_x] == self.registry[registry_y]:
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_6XNN(self, opcode: int) -> None:
         """Sets VX to NN"""
-        registry = get_second_nibble(opcode)
-        value = get_low_byte(opcode)
+        registry, _ = REGISTERS_TABLE[opcode]
+        value = opcode & 0x00FF
 
         self.registry[registry] = value
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_7XNN(self, opcode: int) -> None:
         """Adds NN to VX (carry flag is not changed)"""
-        registry = get_second_nibble(opcode)
-        value = get_low_byte(opcode)
+        registry, _ = REGISTERS_TABLE[opcode]
+        value = opcode & 0x00FF
 
         new_value = (self.registry[registry] + value) & 0xFF
         self.registry[registry] = new_value
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY0(self, opcode: int) -> None:
         """Sets VX to the value of VY"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         self.registry[registry_x] = self.registry[registry_y]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY1(self, opcode: int) -> None:
         """Sets VX to VX OR VY"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         self.registry[registry_x] |= self.registry[registry_y]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY2(self, opcode: int) -> None:
         """Sets VX to VX AND VY"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         self.registry[registry_x] &= self.registry[registry_y]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY3(self, opcode: int) -> None:
         """Sets VX to VX XOR VY"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         self.registry[registry_x] ^= self.registry[registry_y]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY4(self, opcode: int) -> None:
         """Vx is set to the value of Vx + Vy. Vy is not affected.
@@ -291,19 +249,16 @@ class Processor:
         Unlike 7XNN, this addition will affect the carry flag. If the result is larger
         than 255 (and thus overflows the 8-bit register VX), the flag register VF is set
         to 1. If it doesn't overflow, VF is set to 0."""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        registry = self.registry
 
-        value = self.registry[registry_x] + self.registry[registry_y]
+        value = registry[registry_x] + registry[registry_y]
 
-        if value > 255:
-            self.registry[registry_x] = value & 0xFF
-            self.carry_flag = 0b1
-        else:
-            self.registry[registry_x] = value
-            self.carry_flag = 0b0
+        # The carry is the bit that overflows the 8-bit register
+        registry[registry_x] = value & 0xFF
+        registry[0xF] = value >> 8
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY5(self, opcode: int) -> None:
         """Sets VX = VX - VY.
@@ -316,21 +271,19 @@ class Processor:
         and then the subtraction either borrows from VF (setting it to 0) or not.
 
         """
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        registry = self.registry
 
-        value = (self.registry[registry_x] - self.registry[registry_y]) & 0xFF
+        value = registry[registry_x] - registry[registry_y]
 
-        if self.registry[registry_x] >= self.registry[registry_y]:
-            # Heads up!: if vF is also the carry flag, and the carry flag will
-            # be the last to be set, even if it overwrites the operation result.
-            self.registry[registry_x] = value
-            self.carry_flag = 0b1
-        else:
-            self.registry[registry_x] = value
-            self.carry_flag = 0b0
+        # Heads up!: if vF is also the carry flag, and the carry flag will
+        # be the last to be set, even if it overwrites the operation result.
+        # A borrow makes the difference negative, so shifting it 8 bits to the right
+        # gives -1 with a borrow and 0 without it.
+        registry[registry_x] = value & 0xFF
+        registry[0xF] = 1 + (value >> 8)
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY6(self, opcode: int) -> None:
         """vX = vY >> 1
@@ -343,17 +296,15 @@ class Processor:
         2. Shift the value of VX one bit to the right
         3. Set VF to 1 if the bit that was shifted out was 1, or 0 if it was 0
         """
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
-
-        self.registry[registry_x] = self.registry[registry_y]
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        registry = self.registry
 
-        shifted = self.registry[registry_x] & 0b1
+        value = registry[registry_y]
 
-        self.registry[registry_x] = (self.registry[registry_x] >> 1) & 0xFF
-        self.carry_flag = shifted
+        registry[registry_x] = value >> 1
+        registry[0xF] = value & 0b1
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XY7(self, opcode: int) -> None:
         """Sets VX = VY - VX
@@ -365,18 +316,17 @@ class Processor:
         Another way of thinking of it is that VF is set to 1 before the subtraction,
         and then the subtraction either borrows from VF (setting it to 0) or not.
         """
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        registry = self.registry
 
-        value = (self.registry[registry_y] - self.registry[registry_x]) & 0xFF
-        self.registry[registry_x] = value
+        value = registry[registry_y] - registry[registry_x]
 
-        if self.registry[registry_y] > self.registry[registry_x]:
-            self.carry_flag = 0b1
-        else:
-            self.carry_flag = 0b0
+        # A borrow makes the difference negative, so shifting it 8 bits to the right
+        # gives -1 with a borrow and 0 without it.
+        registry[registry_x] = value & 0xFF
+        registry[0xF] = 1 + (value >> 8)
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_8XYE(self, opcode: int) -> None:
         """vX = vY << 1
@@ -388,28 +338,25 @@ class Processor:
         1. Set VX to the value of VY
         2. Shift the value of VX one bit to the left
         3. Set VF to 1 if the bit that was shifted out was 1, or 0 if it was 0"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
-
-        self.registry[registry_x] = self.registry[registry_y]
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        registry = self.registry
 
-        shifted = 0x1 if (self.registry[registry_x] & 0b10000000) > 0 else 0x0
+        value = registry[registry_y]
 
-        self.registry[registry_x] = (self.registry[registry_x] << 1) & 0xFF
-        self.carry_flag = shifted
+        registry[registry_x] = (value << 1) & 0xFF
+        registry[0xF] = value >> 7
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_9XY0(self, opcode: int) -> None:
         """Skips the next instruction if VX does not equal VY. (Usually the next
         instruction is a jump to skip a code block)"""
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
 
         if self.registry[registry_x] != self.registry[registry_y]:
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_ANNN(self, opcode: int) -> None:
         """
@@ -420,7 +367,7 @@ class Processor:
         """
         address = opcode & 0x0FFF
         self.index_registry = address
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_BNNN(self, opcode: int) -> None:
         """Jumps to the address NNN plus V0"""
@@ -431,13 +378,15 @@ class Processor:
     def opcode_CXNN(self, opcode: int) -> None:
         """Sets VX to the result of a bitwise 'and' operation on a random number
         (Typically: 0 to 255) and NN"""
-        registry = get_second_nibble(opcode)
-        value = get_low_byte(opcode)
+        registry, _ = REGISTERS_TABLE[opcode]
+        value = opcode & 0x00FF
 
-        random_value = random.randint(0, 255)
+        # getrandbits is a single call into the Mersenne Twister, much cheaper
+        # than the range handling of randint
+        random_value = random.getrandbits(8)
 
         self.registry[registry] = random_value & value
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_DXYN(self, opcode: int) -> None:
         """
@@ -451,60 +400,56 @@ class Processor:
         If any pixels on the screen were turned “off” by this, the VF flag register
         is set to 1. Otherwise, it's set to 0.
         """
-        registry_x = get_second_nibble(opcode)
-        registry_y = get_third_nibble(opcode)
-        height = get_fourth_nibble(opcode)
+        registry_x, registry_y = REGISTERS_TABLE[opcode]
+        height = opcode & 0x000F
 
-        x = self.registry[registry_x] % self.graphics.width
-        y = self.registry[registry_y] % self.graphics.height
+        graphics = self.graphics
+        x = self.registry[registry_x] % graphics.width
+        y = self.registry[registry_y] % graphics.height
 
-        self.carry_flag = 0
+        # If the drawing is out of bounds, clip it
+        height = min(height, graphics.height - y)
 
         sprite = self.memory[self.index_registry : self.index_registry + height]
 
-        for line, sprite_line in enumerate(sprite):
-            # If the drawing is out of bounds, clip it
-            if y + line >= self.graphics.height:
-                break
+        # Perform a bitwise XOR operation to flip the pixels of each line. If any
+        # pixel on the screen was turned off, set the carry flag to 1
+        xor_byte = graphics.xor_byte
+        collision = 0
+        for line, sprite_line in enumerate(sprite, start=y):
+            collision |= xor_byte(x, line, sprite_line)
 
-            screen_line = self.graphics.get_byte(x, y + line)
+        self.registry[0xF] = collision
 
-            # Perform a bitwise XOR operation to flip the pixels
-            self.graphics.set_byte(x, y + line, sprite_line ^ screen_line)
-
-            # If any pixel on the screen was turned off, set the carry flag to 1
-            if self.carry_flag == 0 and sprite_line & screen_line > 0:
-                self.carry_flag = 1
-
-        self.continue_to_next_instruction()
+        self.program_counter += 2
         self.redraw = True
 
     def opcode_EX9E(self, opcode: int) -> None:
         """Skips the next instruction if the key stored in VX is pressed (usually the
         next instruction is a jump to skip a code block)."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         if self.keypad.is_key_pressed(self.registry[registry_x]):
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_EXA1(self, opcode: int) -> None:
         """Skips the next instruction if the key stored in VX is not pressed (usually
         the next instruction is a jump to skip a code block)."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         if not self.keypad.is_key_pressed(self.registry[registry_x]):
-            self.skip_next_instruction()
+            self.program_counter += 4
         else:
-            self.continue_to_next_instruction()
+            self.program_counter += 2
 
     def opcode_FX07(self, opcode: int) -> None:
         """Sets VX to the value of the delay timer."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         self.registry[registry_x] = self.delay_timer
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX0A(self, opcode: int) -> None:
         """A key press is awaited, and then stored in VX (blocking operation, all
@@ -524,42 +469,42 @@ class Processor:
         if self.keypad.is_key_available():
             self.withhold_execution = False
 
-            registry_x = get_second_nibble(opcode)
+            registry_x, _ = REGISTERS_TABLE[opcode]
             self.registry[registry_x] = self.keypad.get_pressed_key()
-            self.continue_to_next_instruction()
+            self.program_counter += 2
         else:
             self.withhold_execution = True
 
     def opcode_FX15(self, opcode: int) -> None:
         """Sets the delay timer to VX"""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         self.delay_timer = self.registry[registry_x]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX18(self, opcode: int) -> None:
         """Sets the sound timer to VX"""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         self.sound_timer = self.registry[registry_x]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX1E(self, opcode: int) -> None:
         """Adds VX to I. VF is not affected."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         self.index_registry += self.registry[registry_x]
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX29(self, opcode: int) -> None:
         """The index register I is set to the address of the hexadecimal character in
         VX."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         character = self.registry[registry_x]
         self.index_registry = self.font_memory_map[character]
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX33(self, opcode: int) -> None:
         """It takes the number in VX (which is one byte, so it can be any number
@@ -568,15 +513,15 @@ class Processor:
 
         For example, if VX contains 156 (or 9C in hexadecimal), it would put the
         number 1 at the address in I, 5 in address I + 1, and 6 in address I + 2."""
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
 
         value = self.registry[registry_x]
 
-        self.memory[self.index_registry] = value // 100
-        self.memory[self.index_registry + 1] = (value // 10) % 10
-        self.memory[self.index_registry + 2] = value % 10
+        index = self.index_registry
+
+        self.memory[index : index + 3] = _BCD[value]
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX55(self, opcode: int) -> None:
         """The value of each variable register from V0 to VX inclusive (if X is 0, then
@@ -584,12 +529,12 @@ class Processor:
         that's stored in I. V0 will be stored at the address in I, V1 will be stored
         in I + 1, and so on, until VX is stored in I + X.
         """
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
+        end = self.index_registry + registry_x + 1
 
-        for i in range(registry_x + 1):
-            self.memory[self.index_registry + i] = self.registry[i]
+        self.memory[self.index_registry : end] = self.registry[: registry_x + 1]
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def opcode_FX65(self, opcode: int) -> None:
         """The values of each variable register from V0 to VX inclusive (if X is 0, then
@@ -598,21 +543,28 @@ class Processor:
         be filled with the value in I + 1, and so on, until VX is filled with the value
         in I + X.
         """
-        registry_x = get_second_nibble(opcode)
+        registry_x, _ = REGISTERS_TABLE[opcode]
+        end = self.index_registry + registry_x + 1
 
-        for i in range(registry_x + 1):
-            self.registry[i] = self.memory[self.index_registry + i]
+        self.registry[: registry_x + 1] = self.memory[self.index_registry : end]
 
-        self.continue_to_next_instruction()
+        self.program_counter += 2
 
     def emulate(self, cycles: int) -> None:
         """
         Emulate "n" cycles of the CPU. Use this method as main loop of the emulator.
+
+        Equivalent to calling `cycle` "n" times, but the attributes used on every
+        cycle are bound to local variables once, before the loop.
         """
+        memory = self.memory.data
+        handlers = self._handlers
+
         for _ in range(cycles):
-            opcode = self.cycle()
+            program_counter = self.program_counter
+            opcode = memory[program_counter] << 8 | memory[program_counter + 1]
+            handlers[opcode](opcode)
 
-            logger.debug(f"Opcode: {hex(opcode)}")
         logger.debug("Emulation cycle finished")
 
     def cycle(self) -> int:
@@ -620,86 +572,15 @@ class Processor:
         opcode = self.fetch_opcode()
 
         # Decode & execute the opcode
-        match decode(opcode):
-            case OPCODE.x0NNN:
-                self.opcode_0NNN(opcode)
-            case OPCODE.x00E0:
-                self.opcode_00E0()
-            case OPCODE.x00EE:
-                self.opcode_00EE()
-            case OPCODE.x1NNN:
-                self.opcode_1NNN(opcode)
-            case OPCODE.x2NNN:
-                self.opcode_2NNN(opcode)
-            case OPCODE.x3XNN:
-                self.opcode_3XNN(opcode)
-            case OPCODE.x4XNN:
-                self.opcode_4XNN(opcode)
-            case OPCODE.x5XY0:
-                self.opcode_5XY0(opcode)
-            case OPCODE.x6XNN:
-                self.opcode_6XNN(opcode)
-            case OPCODE.x7XNN:
-                self.opcode_7XNN(opcode)
-            case OPCODE.x8XY0:
-                self.opcode_8XY0(opcode)
-            case OPCODE.x8XY1:
-                self.opcode_8XY1(opcode)
-            case OPCODE.x8XY2:
-                self.opcode_8XY2(opcode)
-            case OPCODE.x8XY3:
-                self.opcode_8XY3(opcode)
-            case OPCODE.x8XY4:
-                self.opcode_8XY4(opcode)
-            case OPCODE.x8XY5:
-                self.opcode_8XY5(opcode)
-            case OPCODE.x8XY6:
-                self.opcode_8XY6(opcode)
-            case OPCODE.x8XY7:
-                self.opcode_8XY7(opcode)
-            case OPCODE.x8XYE:
-                self.opcode_8XYE(opcode)
-            case OPCODE.x9XY0:
-                self.opcode_9XY0(opcode)
-            case OPCODE.xANNN:
-                self.opcode_ANNN(opcode)
-            case OPCODE.xBNNN:
-                self.opcode_BNNN(opcode)
-            case OPCODE.xCXNN:
-                self.opcode_CXNN(opcode)
-            case OPCODE.xDXYN:
-                self.opcode_DXYN(opcode)
-            case OPCODE.xEX9E:
-                self.opcode_EX9E(opcode)
-            case OPCODE.xEXA1:
-                self.opcode_EXA1(opcode)
-            case OPCODE.xFX07:
-                self.opcode_FX07(opcode)
-            case OPCODE.xFX0A:
-                self.opcode_FX0A(opcode)
-            case OPCODE.xFX15:
-                self.opcode_FX15(opcode)
-            case OPCODE.xFX18:
-                self.opcode_FX18(opcode)
-            case OPCODE.xFX1E:
-                self.opcode_FX1E(opcode)
-            case OPCODE.xFX29:
-                self.opcode_FX29(opcode)
-            case OPCODE.xFX33:
-                self.opcode_FX33(opcode)
-            case OPCODE.xFX55:
-                self.opcode_FX55(opcode)
-            case OPCODE.xFX65:
-                self.opcode_FX65(opcode)
-
-        # Update timers
-        self.update_timers()
+        self._handlers[opcode](opcode)
 
         return opcode
 
     def update_timers(self) -> None:
         """
-        Updates the delay and sound timers.
+        Updates the delay and sound timers. Timers count down at 60 Hz, regardless
+        of the instruction rate, so this is not part of `cycle` and must be called
+        60 times per second by the game engine.
         """
         # Timers
         if self.delay_timer > 0:
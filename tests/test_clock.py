@@ -0,0 +1,28 @@
+import pytest
+
+from chip8emulator.clock import Clock
+
+
+def test_advance_one_frame():
+    clock = Clock(ips=700)
+
+    # One frame at 60 Hz
+    assert clock.advance(1 / 60) == (11, 1)
+    assert clock.last_update == 1 / 60
+
+
+def test_advance_carries_fractions_over():
+    # Every frame corresponds to 2.5 cycles and 3.75 timer ticks
+    clock = Clock(ips=40)
+    frames = [clock.advance(0.0625 * frame) for frame in range(1, 5)]
+
+    assert frames == [(2, 3), (3, 4), (2, 4), (3, 4)]
+
+
+@pytest.mark.parametrize("now", [30.0, 3600.0])
+def test_advance_after_stall(now):
+    clock = Clock(ips=700)
+
+    # The stall is clamped to the longest catch-up time, for both budgets
+    assert clock.advance(now) == (70, 6)
+    assert clock.last_update == now
@@ -1,6 +1,6 @@
 import pytest
 
-from chip8emulator.decoder import decode
+from chip8emulator.decoder import REGISTERS_TABLE, decode
 from chip8emulator.opcodes import OPCODE
 
 
@@ -45,3 +45,21 @@ from chip8emulator.opcodes import OPCODE
 )
 def test_decode(opcode, expected):
     assert decode(opcode) == expected
+
+
+@pytest.mark.parametrize("opcode", [0x0000, 0x8008, 0x80E8, 0xE000, 0xF0E0])
+def test_decode_unsupported(opcode):
+    assert decode(opcode) is None
+
+
+@pytest.mark.parametrize(
+    "opcode, expected",
+    [
+        (0x0000, (0x0, 0x0)),
+        (0x8AB4, (0xA, 0xB)),
+        (0xD12F, (0x1, 0x2)),
+        (0xFF65, (0xF, 0x6)),
+    ],
+)
+def test_registers_table(opcode, expected):
+    assert REGISTERS_TABLE[opcode] == expected
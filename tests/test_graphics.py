@@ -1,6 +1,5 @@
 import pytest
 from bitarray import bitarray
-from bitarray.util import ba2int
 
 from chip8emulator.graphics import Graphics
 
@@ -9,16 +8,16 @@ def test_graphics_clear():
     graphics = Graphics()
     graphics.clear()
 
-    assert all(ba2int(line) == 0 for line in graphics.pixels)
+    assert all(line == 0 for line in graphics.pixels)
 
 
 @pytest.mark.parametrize(
     "pixels, x, y, expected",
     [
-        ([bitarray("1000"), bitarray("0000")], 0, 0, 1),
-        ([bitarray("0001"), bitarray("0000")], 3, 0, 1),
-        ([bitarray("0000"), bitarray("1000")], 0, 1, 1),
-        ([bitarray("0000"), bitarray("0001")], 3, 1, 1),
+        ([0b1000, 0b0000], 0, 0, 1),
+        ([0b0001, 0b0000], 3, 0, 1),
+        ([0b0000, 0b1000], 0, 1, 1),
+        ([0b0000, 0b0001], 3, 1, 1),
     ],
 )
 def test_graphics_get(pixels, x, y, expected):
@@ -32,21 +31,21 @@ def test_graphics_get(pixels, x, y, expected):
     "pixels",
     [
         [
-            bitarray("0000 0001 0010 0011"),
-            bitarray("0100 0101 0110 0111"),
-            bitarray("1000 1001 1010 1011"),
-            bitarray("1100 1101 1110 1111"),
+            0b0000_0001_0010_0011,
+            0b0100_0101_0110_0111,
+            0b1000_1001_1010_1011,
+            0b1100_1101_1110_1111,
         ],
     ],
 )
 @pytest.mark.parametrize(
     "x, y, expected",
     [
-        (0, 0, ba2int(bitarray("0000 0001"))),
-        (12, 0, ba2int(bitarray("0011 0000"))),
-        (0, 3, ba2int(bitarray("1100 1101"))),
-        (12, 3, ba2int(bitarray("1111 1100"))),
-        (15, 3, ba2int(bitarray("1110 0110"))),
+        (0, 0, (0b0000_0001)),
+        (12, 0, (0b0011_0000)),
+        (0, 3, (0b1100_1101)),
+        (12, 3, (0b1111_1100)),
+        (15, 3, (0b1110_0110)),
     ],
 )
 def test_graphics_get_byte(pixels, x, y, expected):
@@ -59,10 +58,10 @@ def test_graphics_get_byte(pixels, x, y, expected):
 @pytest.mark.parametrize(
     "x, y, value, expected",
     [
-        (0, 0, 1, [bitarray("1000"), bitarray("0000")]),
-        (3, 0, 1, [bitarray("0001"), bitarray("0000")]),
-        (0, 1, 1, [bitarray("0000"), bitarray("1000")]),
-        (3, 1, 1, [bitarray("0000"), bitarray("0001")]),
+        (0, 0, 1, [0b1000, 0b0000]),
+        (3, 0, 1, [0b0001, 0b0000]),
+        (0, 1, 1, [0b0000, 0b1000]),
+        (3, 1, 1, [0b0000, 0b0001]),
     ],
 )
 def test_graphics_set(x, y, value, expected):
@@ -80,10 +79,10 @@ def test_graphics_set(x, y, value, expected):
             0,
             0xFF,
             [
-                bitarray("1111 1111 0000 0000"),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
+                0b1111_1111_0000_0000,
+                0,
+                0,
+                0,
             ],
         ),
         (
@@ -91,10 +90,10 @@ def test_graphics_set(x, y, value, expected):
             0,
             0xAB,
             [
-                bitarray("1011 0000 0000 1010"),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
+                0b1011_0000_0000_1010,
+                0,
+                0,
+                0,
             ],
         ),
         (
@@ -102,10 +101,10 @@ def test_graphics_set(x, y, value, expected):
             1,
             0xFF,
             [
-                bitarray("0" * 16),
-                bitarray("0000 1111 1111 0000"),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
+                0,
+                0b0000_1111_1111_0000,
+                0,
+                0,
             ],
         ),
         (
@@ -113,10 +112,10 @@ def test_graphics_set(x, y, value, expected):
             3,
             0xAB,
             [
-                bitarray("0" * 16),
-                bitarray("0" * 16),
-                bitarray("0" * 16),
-                bitarray("1010 1100 0000 0010"),
+                0,
+                0,
+                0,
+                0b1010_1100_0000_0010,
             ],
         ),
     ],
@@ -128,6 +127,43 @@ def test_graphics_set_byte(x, y, value, expected):
     assert graphics.pixels == expected
 
 
+@pytest.mark.parametrize(
+    "pixels, x, y, value, expected, collision",
+    [
+        (
+            [0b0000_0000_0000_0000, 0],
+            4,
+            0,
+            0xFF,
+            [0b0000_1111_1111_0000, 0],
+            0,
+        ),
+        (
+            [0, 0b0000_1111_0000_0000],
+            4,
+            1,
+            0xAA,
+            [0, 0b0000_0101_1010_0000],
+            1,
+        ),
+        (
+            [0b1100_0000_0000_0001, 0],
+            12,
+            0,
+            0xAB,
+            [0b0111_0000_0000_1011, 0],
+            1,
+        ),
+    ],
+)
+def test_graphics_xor_byte(pixels, x, y, value, expected, collision):
+    graphics = Graphics(width=16, height=2)
+    graphics.pixels = pixels
+
+    assert graphics.xor_byte(x, y, value) == collision
+    assert graphics.pixels == expected
+
+
 def test_assert_raises():
     graphics = Graphics(4, 2)
 
@@ -143,25 +179,46 @@ def test_assert_raises():
 
 
 @pytest.mark.parametrize(
-    "pixels, expected",
+    "width, pixels, expected",
     [
-        (bitarray("1010101001010101"), [0xAA, 0x55]),
+        (8, [0b1010_1010, 0b0101_0101], [0xAA, 0x55]),
+        # Rows are padded with 0s up to the next byte
+        (12, [0b1000_0000_0001, 0b0000_0000_0000], [0x80, 0x10, 0x00, 0x00]),
     ],
 )
-def test_as_list_of_integers(pixels, expected):
-    graphics = Graphics(8, 2)
+def test_as_list_of_integers(width, pixels, expected):
+    graphics = Graphics(width, 2)
     graphics.pixels = pixels
 
     assert graphics.as_list_of_integers() == expected
 
 
+@pytest.mark.parametrize(
+    "width, pixels, expected",
+    [
+        (8, [0b1010_1010, 0b0101_0101], bitarray("1010101001010101")),
+        # Rows are not padded when the width is not a multiple of 8
+        (
+            12,
+            [0b1000_0000_0001, 0b0110_0000_0000],
+            bitarray("100000000001011000000000"),
+        ),
+    ],
+)
+def test_as_bitarray(width, pixels, expected):
+    graphics = Graphics(width, 2)
+    graphics.pixels = pixels
+
+    assert graphics.as_bitarray() == expected
+
+
 @pytest.mark.parametrize(
     "pixels, expected",
     [
         (
             [
-                bitarray("10100101"),
-                bitarray("11110000"),
+                0b10100101,
+                0b11110000,
             ],
             "\n".join(
                 [
@@ -173,7 +230,7 @@ def test_as_list_of_integers(pixels, expected):
     ],
 )
 def test_print(pixels, expected):
-    graphics = Graphics(4, 2)
+    graphics = Graphics(8, 2)
     graphics.pixels = pixels
 
     assert str(graphics) == expected
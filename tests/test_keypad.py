@@ -46,3 +46,11 @@ def test_release_key(keypad):
     keypad.release_key(0x1)
     assert keypad.is_key_pressed(0x1) is False
     assert keypad.accumulator == 0x1
+
+
+@pytest.mark.parametrize("key", [-1, 0x10])
+def test_invalid_key(keypad, key):
+    keypad.press_key(key)
+    assert keypad.keys == 0
+    keypad.release_key(key)
+    assert keypad.accumulator == -1
@@ -3,14 +3,20 @@ import pytest
 from chip8emulator.memory import Memory
 
 
-def test_validate_address():
-    size = 4096
+@pytest.mark.parametrize("address", [4096, 4097])
+def test_address_out_of_range(address):
     memory = Memory()
-    with pytest.raises(ValueError):
-        memory._validate_address(address=size + 1)
+    with pytest.raises(IndexError):
+        memory[address]
+
+    with pytest.raises(IndexError):
+        memory[address] = 0x00
+
 
-    assert memory._validate_address(address=0)
-    assert memory._validate_address(address=size)
+def test_value_too_large():
+    memory = Memory()
+    with pytest.raises(ValueError):
+        memory[0] = 0x100
 
 
 @pytest.mark.parametrize(
@@ -26,3 +32,42 @@ def test_get_set_item(address, value, expected):
 
     memory[address] = value
     assert memory[address] == expected
+
+
+def test_set_slice():
+    memory = Memory()
+
+    memory[0x200:0x203] = b"\xa0\xb0\xc0"
+    assert memory[0x200:0x203] == b"\xa0\xb0\xc0"
+
+
+@pytest.mark.parametrize("address", [-1, -4096])
+def test_negative_address(address):
+    memory = Memory()
+    with pytest.raises(IndexError):
+        memory[address]
+
+    with pytest.raises(IndexError):
+        memory[address] = 0x07
+
+    assert memory[len(memory) - 1] == 0x00
+
+
+@pytest.mark.parametrize(
+    "address, value",
+    [
+        # Past the end of the memory
+        (slice(4090, 4100), bytes(10)),
+        # Negative bounds
+        (slice(-2, None), bytes(2)),
+        # Value longer and shorter than the range
+        (slice(0x200, 0x202), b"\xa0\xb0\xc0"),
+        (slice(0x200, 0x203), b"\xa0"),
+    ],
+)
+def test_set_slice_out_of_range(address, value):
+    memory = Memory()
+    with pytest.raises(IndexError):
+        memory[address] = value
+
+    assert len(memory) == 4096
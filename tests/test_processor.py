@@ -2,8 +2,8 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from bitarray import bitarray
 
+import chip8emulator.processor
 from chip8emulator.graphics import Graphics
 from chip8emulator.keypad import Keypad
 from chip8emulator.memory import Memory
@@ -31,7 +31,7 @@ def processor():
 )
 def test_fetch_opcode(memory_content, program_counter, expected_opcode, processor):
     # Set up a test case with a specific opcode
-    processor.memory = [byte for byte in memory_content]
+    processor.memory = Memory(memory_content)
     processor.program_counter = program_counter
 
     # Call the fetch_opcode method
@@ -58,6 +58,14 @@ def test_load_program(program_content, processor):
             assert processor.memory[0x200 + i] == byte
 
 
+def test_load_font(processor):
+    font = (Path(chip8emulator.processor.__file__).parent / "fonts.ch8").read_bytes()
+
+    assert processor.memory[0x050 : 0x050 + len(font)] == font
+    assert processor.font_memory_map[0x0] == 0x050
+    assert processor.font_memory_map[0xF] == 0x050 + 5 * 0xF
+
+
 @pytest.mark.parametrize("opcode, expected_registers", [(0xA333, 0x0333)])
 def test_opcode_annnn(opcode, expected_registers, processor):
     processor.opcode_ANNN(opcode)
@@ -69,7 +77,7 @@ def test_opcode_00EE(processor):
     processor.stack_pointer = 3
     processor.stack = [0x0000, 0x0001, 0x0002] + [0] * 13
     processor.program_counter = 0x111
-    processor.opcode_00EE()
+    processor.opcode_00EE(0x00EE)
 
     # The stack pointer has been decreased
     assert processor.stack_pointer == 2
@@ -322,6 +330,7 @@ def test_opcode_8XY6(
         (3, 4, 0x33, 0x22, 0xEF, 0b0),
         (3, 4, 0x11, 0x22, 0x11, 0b1),
         (3, 4, 0x8C, 0x78, 0xEC, 0b0),
+        (3, 4, 0x00, 0x00, 0x00, 0b1),
     ],
 )
 def test_opcode_8XY7(
@@ -396,7 +405,7 @@ def test_opcode_9XY0(
     "opcode, v0, expected_program_counter",
     [
         (0xB123, 0x0000, 0x0123),
-        (0xB456, 0xB100, 0xB556),
+        (0xB456, 0xFF, 0x0555),
     ],
 )
 def test_opcode_BNNN(processor, opcode, v0, expected_program_counter):
@@ -407,10 +416,10 @@ def test_opcode_BNNN(processor, opcode, v0, expected_program_counter):
 
 @pytest.mark.parametrize("registry, opcode, expected", [(3, 0xC3AA, 0xAA)])
 def test_opcode_CXNN(processor, registry, opcode, expected, monkeypatch):
-    def mock_randint(a, b):
+    def mock_getrandbits(k):
         return 0xFF
 
-    monkeypatch.setattr("random.randint", mock_randint)
+    monkeypatch.setattr("random.getrandbits", mock_getrandbits)
 
     processor.program_counter = 0x110
     processor.opcode_CXNN(opcode)
@@ -431,8 +440,8 @@ def test_opcode_CXNN(processor, registry, opcode, expected, monkeypatch):
                 0xCC,
             ],
             [
-                bitarray("0000 0000 0011 0011"),
-                bitarray("0000 0000 1100 1100"),
+                0b0000_0000_0011_0011,
+                0b0000_0000_1100_1100,
             ],
             1,
         ),
@@ -445,8 +454,8 @@ def test_opcode_CXNN(processor, registry, opcode, expected, monkeypatch):
                 0x33,
             ],
             [
-                bitarray("1111 0011 0011 1111"),
-                bitarray("1111 1100 1100 1111"),
+                0b1111_0011_0011_1111,
+                0b1111_1100_1100_1111,
             ],
             0,
         ),
@@ -472,8 +481,8 @@ def test_opcode_DXYN(
     processor.graphics.width = 16
     processor.graphics.height = 2
     processor.graphics.pixels = [
-        bitarray("0011 0011 0011 0011"),
-        bitarray("1100 1100 1100 1100"),
+        0b0011_0011_0011_0011,
+        0b1100_1100_1100_1100,
     ]
 
     processor.opcode_DXYN(int(f"0xD{registry_x}{registry_y}{height}", 16))
@@ -554,11 +563,11 @@ def test_opcode_FX0A(processor):
     processor.opcode_FX0A(int(f"0x{first_byte}{second_byte}", 16))
     assert processor.withhold_execution is True
 
-    # The timers are updated
+    # The execution stays paused, while the timers keep being updated
     processor.cycle()
+    processor.update_timers()
     assert processor.sound_timer == 3
-    processor.cycle()
-    assert processor.sound_timer == 2
+    assert processor.program_counter == 0x110
 
     # Press a key
     processor.keypad.press_key(expected_key)
@@ -739,6 +748,51 @@ def test_opcode_FX65(
     assert processor.program_counter == 0x202
 
 
+@pytest.mark.parametrize(
+    "handler, opcode", [("FX33", 0xFF33), ("FX55", 0xFF55), ("FX65", 0xFF65)]
+)
+def test_opcode_memory_out_of_range(processor, handler, opcode):
+    processor.index_registry = 0xFFE
+
+    with pytest.raises(IndexError):
+        getattr(processor, f"opcode_{handler}")(opcode)
+
+    assert len(processor.memory) == 4096
+    assert len(processor.registry) == 16
+
+
+def test_emulate(processor):
+    # V3 = 0x05; V3 += 0x01; V4 = V3
+    program = [0x63, 0x05, 0x73, 0x01, 0x84, 0x30]
+    for i, byte in enumerate(program):
+        processor.memory[0x200 + i] = byte
+
+    processor.emulate(3)
+
+    assert processor.registry[0x3] == 0x06
+    assert processor.registry[0x4] == 0x06
+    assert processor.program_counter == 0x206
+
+
+def test_update_timers(processor):
+    processor.delay_timer = 2
+    processor.sound_timer = 1
+
+    # Running instructions does not update the timers
+    processor.emulate(1)
+    assert processor.delay_timer == 2
+    assert processor.sound_timer == 1
+
+    processor.update_timers()
+    assert processor.delay_timer == 1
+    assert processor.sound_timer == 0
+    assert processor.sound_flag is True
+
+    processor.update_timers()
+    assert processor.delay_timer == 0
+    assert processor.sound_timer == 0
+
+
 @pytest.mark.parametrize(
     "test_suite, test_suite_output, last_pc",
     [